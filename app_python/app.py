@@ -1,18 +1,29 @@
 import os
+import math
+import time
 import socket
 import platform
 import logging
-from datetime import datetime, timezone
+from datetime import UTC, datetime
+from functools import partial
 from typing import Dict, Any
 
-from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+import orjson
+import ormsgpack
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.routing import Route
 
 # Configuration from environment variables
 HOST = os.getenv("HOST", "0.0.0.0")
 PORT = int(os.getenv("PORT", "5000"))
 DEBUG = os.getenv("DEBUG", "True").lower() == "true"
+ENABLE_CORS = os.getenv("ENABLE_CORS", "False").lower() == "true"
+WORKERS = int(os.getenv("WORKERS", "1"))
+if WORKERS < 1:
+    raise ValueError(f"WORKERS must be a positive integer, got {WORKERS}")
 
 # Logging configuration
 logging.basicConfig(
@@ -24,34 +35,93 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+class UTCJSONResponse(ORJSONResponse):
+    """ORJSONResponse that renders UTC datetimes with a trailing Z (RFC 3339)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=(
+                orjson.OPT_UTC_Z
+                | orjson.OPT_NAIVE_UTC
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_SERIALIZE_NUMPY
+            )
+        )
+
+
 # FastAPI application
 app = FastAPI(
     title="DevOps Info Service",
     version="1.0.0",
     description="Service providing system information and health status",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=UTCJSONResponse
 )
 
-# CORS middleware (optional, useful for web frontend later)
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# CORS middleware (opt-in, useful for web frontend later)
+if ENABLE_CORS:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+# Gzip compression for larger responses (level 1 keeps CPU cost low)
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=1)
+
+# Application start time (monotonic, unaffected by wall-clock adjustments)
+START_MONOTONIC_NS = time.monotonic_ns()
 
-# Application start time
-START_TIME = datetime.now(timezone.utc)
+# Current UTC time, bound once to skip the attribute/global lookups per call
+utc_now = partial(datetime.now, UTC)
+
+# Service and system information (constant for the process lifetime)
+STATIC_INFO = {
+    "service": {
+        "name": "devops-info-service",
+        "version": "1.0.0",
+        "description": "DevOps course info service",
+        "framework": "FastAPI"
+    },
+    "system": {
+        "hostname": socket.gethostname(),
+        "platform": platform.system(),
+        "platform_version": platform.version(),
+        "architecture": platform.machine(),
+        "cpu_count": os.cpu_count() or 0,
+        "python_version": platform.python_version()
+    },
+    "endpoints": [
+        {"path": "/", "method": "GET", "description": "Service information"},
+        {"path": "/health", "method": "GET", "description": "Health check"},
+        {"path": "/healthz", "method": "GET", "description": "Liveness probe"},
+        {"path": "/docs", "method": "GET", "description": "OpenAPI documentation"},
+        {"path": "/redoc", "method": "GET", "description": "ReDoc documentation"}
+    ]
+}
+
+# Pre-serialized JSON around the per-request part of the / response
+STATIC_JSON_PREFIX = orjson.dumps({
+    "service": STATIC_INFO["service"],
+    "system": STATIC_INFO["system"]
+})[:-1] + b","
+STATIC_JSON_SUFFIX = b"," + orjson.dumps({"endpoints": STATIC_INFO["endpoints"]})[1:]
+
+
+def get_uptime_seconds() -> int:
+    """Calculate application uptime in whole seconds."""
+    return (time.monotonic_ns() - START_MONOTONIC_NS) // 1_000_000_000
 
 
 def get_uptime() -> Dict[str, Any]:
     """Calculate application uptime."""
-    delta = datetime.now(timezone.utc) - START_TIME
-    seconds = int(delta.total_seconds())
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
+    seconds = get_uptime_seconds()
+    hours, minutes = divmod(seconds // 60, 60)
     
     return {
         "seconds": seconds,
@@ -59,79 +129,166 @@ def get_uptime() -> Dict[str, Any]:
     }
 
 
-@app.get("/", response_class=JSONResponse)
-async def get_service_information(request: Request) -> Dict[str, Any]:
+def parse_accept(accept: bytes) -> Dict[bytes, float]:
+    """Parse an Accept header into a mapping of media range to quality."""
+    ranges = {}
+    for media_range in accept.split(b","):
+        media_type, *params = media_range.split(b";")
+        media_type = media_type.strip().lower()
+        if not media_type:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition(b"=")
+            if name.strip().lower() == b"q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+                # Malformed, non-finite or out-of-range q makes the range unacceptable
+                if not (math.isfinite(quality) and 0.0 <= quality <= 1.0):
+                    quality = 0.0
+        ranges[media_type] = max(quality, ranges.get(media_type, 0.0))
+    return ranges
+
+
+def media_type_quality(ranges: Dict[bytes, float], media_type: bytes) -> float:
+    """Quality of a media type, taken from its most specific matching range."""
+    wildcard = media_type.partition(b"/")[0] + b"/*"
+    for candidate in (media_type, wildcard, b"*/*"):
+        if candidate in ranges:
+            return ranges[candidate]
+    return 0.0
+
+
+def accepts_msgpack(accept: bytes) -> bool:
+    """Check whether the client prefers MessagePack over JSON."""
+    ranges = parse_accept(accept)
+    msgpack_quality = media_type_quality(ranges, b"application/msgpack")
+    return msgpack_quality > media_type_quality(ranges, b"application/json")
+
+
+# Endpoints stay async: nothing in them blocks (system info is precomputed),
+# so running on the event loop avoids a threadpool hop for every request.
+@app.get("/", response_class=UTCJSONResponse, response_model=None)
+async def get_service_information(request: Request) -> Response:
     """
     Main endpoint - returns comprehensive service and system information.
     """
-    logger.info(f"Request received: {request.method} {request.url.path}")
+    scope = request.scope
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Request received: {scope['method']} {scope['path']}")
     
     # Collect all information
     uptime_info = get_uptime()
+    runtime = {
+        "uptime_seconds": uptime_info["seconds"],
+        "uptime_human": uptime_info["human"],
+        "current_time": utc_now(),
+        "timezone": "UTC"
+    }
+    
+    # Read headers straight from the ASGI scope instead of building request.headers;
+    # like Headers.get(), the first occurrence of a repeated header wins
+    user_agent = None
+    accept = None
+    for name, value in scope["headers"]:
+        if name == b"user-agent" and user_agent is None:
+            user_agent = value
+        elif name == b"accept" and accept is None:
+            accept = value
+    if user_agent is None:
+        user_agent = b"unknown"
+    if accept is None:
+        accept = b""
     
-    # Prepare response
-    response = {
-        "service": {
-            "name": "devops-info-service",
-            "version": "1.0.0",
-            "description": "DevOps course info service",
-            "framework": "FastAPI"
-        },
-        "system": {
-            "hostname": socket.gethostname(),
-            "platform": platform.system(),
-            "platform_version": platform.version(),
-            "architecture": platform.machine(),
-            "cpu_count": os.cpu_count() or 0,
-            "python_version": platform.python_version()
-        },
-        "runtime": {
-            "uptime_seconds": uptime_info["seconds"],
-            "uptime_human": uptime_info["human"],
-            "current_time": datetime.now(timezone.utc).isoformat(),
-            "timezone": "UTC"
-        },
-        "request": {
-            "client_ip": request.client.host if request.client else "unknown",
-            "user_agent": request.headers.get("user-agent", "unknown"),
-            "method": request.method,
-            "path": request.url.path
-        },
-        "endpoints": [
-            {"path": "/", "method": "GET", "description": "Service information"},
-            {"path": "/health", "method": "GET", "description": "Health check"},
-            {"path": "/docs", "method": "GET", "description": "OpenAPI documentation"},
-            {"path": "/redoc", "method": "GET", "description": "ReDoc documentation"}
-        ]
+    client = scope.get("client")
+    request_info = {
+        "client_ip": client[0] if client else "unknown",
+        "user_agent": user_agent.decode("latin-1"),
+        "method": scope["method"],
+        "path": scope["path"]
     }
     
-    return response
+    # MessagePack for clients that ask for it
+    if accepts_msgpack(accept):
+        return Response(
+            content=ormsgpack.packb({
+                "service": STATIC_INFO["service"],
+                "system": STATIC_INFO["system"],
+                "runtime": runtime,
+                "request": request_info,
+                "endpoints": STATIC_INFO["endpoints"]
+            }, option=ormsgpack.OPT_UTC_Z),
+            media_type="application/msgpack",
+            headers={"Vary": "Accept"}
+        )
+    
+    # Serialize only the dynamic sections and splice them into the static JSON
+    dynamic = orjson.dumps(
+        {"runtime": runtime, "request": request_info},
+        option=orjson.OPT_UTC_Z
+    )
+    
+    return Response(
+        content=STATIC_JSON_PREFIX + dynamic[1:-1] + STATIC_JSON_SUFFIX,
+        media_type="application/json",
+        headers={"Vary": "Accept"}
+    )
 
 
-@app.get("/health", response_class=JSONResponse)
-async def health_check() -> Dict[str, Any]:
+@app.get("/health", response_class=UTCJSONResponse, response_model=None)
+async def health_check() -> UTCJSONResponse:
     """
     Health check endpoint for monitoring and Kubernetes probes.
     """
-    uptime_info = get_uptime()
+    now = utc_now()
     
-    return {
+    return UTCJSONResponse(content={
         "status": "healthy",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "uptime_seconds": uptime_info["seconds"]
-    }
+        "timestamp": now,
+        "uptime_seconds": get_uptime_seconds()
+    })
+
+
+class LivenessProbe:
+    """
+    Minimal ASGI endpoint for Kubernetes liveness/readiness probes.
+    Sends a prebuilt constant response without building Request/Response objects.
+    """
+
+    body = b'{"status":"healthy"}'
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+    ]
+
+    async def __call__(self, scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": self.headers
+        })
+        await send({
+            "type": "http.response.body",
+            "body": b"" if scope["method"] == "HEAD" else self.body
+        })
+
+
+# Registered first so probes match before any FastAPI route
+app.router.routes.insert(0, Route("/healthz", endpoint=LivenessProbe(), methods=["GET", "HEAD"]))
 
 
 @app.exception_handler(404)
 async def not_found_handler(request: Request, exc):
     """Custom 404 error handler."""
-    logger.error(f"Not found server error: {exc}")
-    return JSONResponse(
+    logger.warning("Not found: %s", exc)
+    return UTCJSONResponse(
         status_code=404,
         content={
             "error": "Not Found",
             "message": f"The requested endpoint {request.url.path} does not exist",
-            "available_endpoints": ["/", "/health", "/docs", "/redoc"]
+            "available_endpoints": ["/", "/health", "/healthz", "/docs", "/redoc"]
         }
     )
 
@@ -139,8 +296,8 @@ async def not_found_handler(request: Request, exc):
 @app.exception_handler(500)
 async def internal_error_handler(request: Request, exc):
     """Custom 500 error handler."""
-    logger.error(f"Internal server error: {exc}")
-    return JSONResponse(
+    logger.exception("Internal server error: %s", exc)
+    return UTCJSONResponse(
         status_code=500,
         content={
             "error": "Internal Server Error",
@@ -154,10 +311,16 @@ if __name__ == "__main__":
     logger.info(f"Starting DevOps Info Service on {HOST}:{PORT}")
     logger.info(f"Debug mode: {DEBUG}")
     
+    # Reload only works with a single process, so workers are used outside debug mode
     uvicorn.run(
         "app:app",
         host=HOST,
         port=PORT,
         reload=DEBUG,
+        workers=1 if DEBUG else WORKERS,
+        # uvloop is not available on Windows
+        loop="asyncio" if platform.system() == "Windows" else "uvloop",
+        http="httptools",
+        access_log=DEBUG,
         log_level="debug" if DEBUG else "info"
     )
\ No newline at end of file
@@ -0,0 +1,73 @@
+import ormsgpack
+from fastapi.testclient import TestClient
+
+from app import accepts_msgpack, app
+
+client = TestClient(app)
+
+
+def vary_tokens(response):
+    return [value.strip() for value in response.headers["vary"].split(",")]
+
+
+def test_root_returns_json_by_default():
+    response = client.get("/", headers={"user-agent": "pytest"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert "Accept" in vary_tokens(response)
+    data = response.json()
+    assert list(data) == ["service", "system", "runtime", "request", "endpoints"]
+    assert data["request"]["user_agent"] == "pytest"
+
+
+def test_root_returns_msgpack_when_accepted():
+    response = client.get("/", headers={"accept": "application/msgpack"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/msgpack"
+    assert "Accept" in vary_tokens(response)
+    data = ormsgpack.unpackb(response.content)
+    assert data["service"]["name"] == "devops-info-service"
+    assert data["runtime"]["timezone"] == "UTC"
+
+
+def test_root_ignores_msgpack_with_zero_quality():
+    response = client.get("/", headers={"accept": "application/msgpack;q=0, application/json"})
+
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_root_prefers_json_when_ranked_higher():
+    response = client.get("/", headers={"accept": "application/msgpack;q=0.1, application/json;q=1"})
+
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_root_ignores_msgpack_with_nan_quality():
+    response = client.get("/", headers={"accept": "application/msgpack;q=nan"})
+
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_root_reports_first_user_agent_header():
+    response = client.get("/", headers=[("user-agent", "first"), ("user-agent", "second")])
+
+    assert response.json()["request"]["user_agent"] == "first"
+
+
+def test_accepts_msgpack():
+    assert accepts_msgpack(b"application/msgpack")
+    assert accepts_msgpack(b"application/json;q=0.9, Application/MsgPack; q=1")
+    assert not accepts_msgpack(b"")
+    assert not accepts_msgpack(b"application/json")
+    assert not accepts_msgpack(b"application/msgpack;q=0")
+    assert not accepts_msgpack(b"application/msgpack;q=0.0")
+    assert not accepts_msgpack(b"application/msgpack;q=nan")
+    assert not accepts_msgpack(b"application/msgpack;q=inf")
+    assert not accepts_msgpack(b"application/msgpack;q=0.1, application/json;q=1")
+    assert not accepts_msgpack(b"application/msgpack;q=0.5, application/json;q=0.5")
+    assert not accepts_msgpack(b"application/*, application/msgpack;q=0.9")
+    assert not accepts_msgpack(b"*/*")
+    assert accepts_msgpack(b"application/msgpack, */*;q=0.8")
+    assert accepts_msgpack(b"application/msgpack, application/json;q=0.5")